@@ -1,16 +1,31 @@
 # BluePulse ML Platform - FastAPI Backend
 from fastapi import FastAPI, HTTPException, File, UploadFile, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.decorator import cache
+from redis import asyncio as aioredis
+from pydantic import BaseModel, ConfigDict
+import ahocorasick
+import base64
+import time
 import uvicorn
+import aiofiles
 import asyncio
+import orjson
+import math
 import os
 import json
 import numpy as np
 import pandas as pd
+import torch
+from numba import njit, prange
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import BinaryIO, List, Optional, Dict, Any
 import logging
 from pathlib import Path
 
@@ -24,104 +39,162 @@ app = FastAPI(
     description="Advanced Marine Data Analytics Platform with AI/ML capabilities",
     version="2.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse
 )
 
-# CORS middleware
+# CORS middleware: concrete origins let Starlette answer with precomputed
+# headers instead of echoing the Origin per request (a wildcard is also
+# spec-invalid alongside allow_credentials)
+ALLOWED_ORIGINS = os.getenv(
+    "BLUEPULSE_ALLOWED_ORIGINS",
+    "http://localhost:3000,http://localhost:8000"
+).split(",")
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure for production
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST"],
     allow_headers=["*"],
 )
 
+# Compress larger JSON payloads (forecasts, map data) on the wire;
+# small responses are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 # Mount static files
 app.mount("/static", StaticFiles(directory="frontend"), name="static")
 
-# Global variables for data storage (use database in production)
-species_data = []
-oceanographic_data = []
-ml_models = {}
-training_status = {}
+# Redis connection (cache backend and shared state)
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+redis_client = aioredis.from_url(REDIS_URL, decode_responses=True)
 
-# ============================================================================
-# API ENDPOINTS
-# ============================================================================
+@app.on_event("startup")
+async def init_cache():
+    """Initialize the Redis-backed response cache"""
+    FastAPICache.init(RedisBackend(aioredis.from_url(REDIS_URL)), prefix="bluepulse-cache")
 
-@app.get("/", response_class=HTMLResponse)
-async def serve_index():
-    """Serve the main application"""
-    with open("frontend/index.html", "r") as f:
-        return HTMLResponse(content=f.read())
+# Upload handling
+UPLOAD_DIR = Path("uploads")
+UPLOAD_DIR.mkdir(exist_ok=True)
+_UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MB
+_VALID_EDNA_EXTENSIONS = (".fasta", ".fastq", ".fa", ".fq")
 
-@app.get("/api/health")
-async def health_check():
-    """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "version": "2.0.0",
-        "services": {
-            "api": "online",
-            "ml_inference": "online",
-            "database": "online"
-        }
-    }
+# Shared generator for synthetic signals; constructing one per request
+# would redo the seeding work and hit the legacy global-state lock
+_RNG = np.random.default_rng(42)
+
+# Mutable state (training status etc.) lives in Redis hashes rather than
+# module globals, so it is shared across Uvicorn workers and survives
+# restarts
 
 # ============================================================================
-# DASHBOARD ENDPOINTS
+# PRECOMPUTED RESPONSES
 # ============================================================================
 
-@app.get("/api/dashboard/stats")
-async def get_dashboard_stats():
-    """Get dashboard KPI statistics"""
-    return {
-        "totalSpecies": 5247,
-        "aiModels": 8,
-        "monitoringStations": 15,
-        "predictionsToday": 1847,
-        "dataQuality": 94.2,
-        "systemUptime": "99.8%"
+# Static payloads are serialized once at import time so the hot read-only
+# endpoints reduce to a buffer write instead of rebuilding and re-serializing
+# the same dict on every request. Payloads that carry a current timestamp
+# keep a sentinel that is patched in cheaply per request.
+_TS_SENTINEL = b"__TS__"
+
+_HEALTH_TEMPLATE = orjson.dumps({
+    "status": "healthy",
+    "timestamp": "__TS__",
+    "version": "2.0.0",
+    "services": {
+        "api": "online",
+        "ml_inference": "online",
+        "database": "online"
     }
+})
+
+_DASHBOARD_STATS = orjson.dumps({
+    "totalSpecies": 5247,
+    "aiModels": 8,
+    "monitoringStations": 15,
+    "predictionsToday": 1847,
+    "dataQuality": 94.2,
+    "systemUptime": "99.8%"
+})
+
+_OCEAN_PARAMETERS_TEMPLATE = orjson.dumps({
+    "parameters": {
+        "temperature": {"value": 28.4, "unit": "°C", "trend": 0.2, "status": "normal"},
+        "salinity": {"value": 34.2, "unit": "ppt", "trend": 0.0, "status": "normal"},
+        "chlorophyll": {"value": 2.1, "unit": "mg/m³", "trend": -0.3, "status": "normal"},
+        "ph": {"value": 8.1, "unit": "", "trend": 0.0, "status": "normal"},
+        "oxygen": {"value": 6.8, "unit": "mg/L", "trend": 0.1, "status": "normal"}
+    },
+    "timestamp": "__TS__"
+})
 
-@app.get("/api/dashboard/recent-activity")
-async def get_recent_activity():
-    """Get recent system activity"""
-    activities = [
+_BIODIVERSITY_HOTSPOTS = orjson.dumps({
+    "hotspots": [
+        {"location": "Kochi", "diversity_index": 4.2, "species_count": 156},
+        {"location": "Trivandrum", "diversity_index": 3.8, "species_count": 134},
+        {"location": "Calicut", "diversity_index": 2.9, "species_count": 98}
+    ]
+})
+
+_AVAILABLE_MODELS = orjson.dumps({
+    "models": [
+        {
+            "id": "otolith",
+            "name": "ResNet Otolith Classifier",
+            "type": "image_classification",
+            "status": "trained",
+            "accuracy": 94.2,
+            "last_trained": "2025-09-26T06:18:00Z"
+        },
+        {
+            "id": "lstm",
+            "name": "LSTM Environmental Predictor",
+            "type": "time_series",
+            "status": "training",
+            "accuracy": 91.3,
+            "last_trained": "2025-09-26T04:20:00Z"
+        },
+        {
+            "id": "edna",
+            "name": "Random Forest eDNA Classifier",
+            "type": "classification",
+            "status": "deployed",
+            "accuracy": 96.1,
+            "last_trained": "2025-09-25T18:45:00Z"
+        }
+    ]
+})
+
+_RECENT_ACTIVITY_TEMPLATE = orjson.dumps({
+    "activities": [
         {
             "id": 1,
             "type": "species_detection",
             "message": "New species detected: Pristis zijsron",
-            "timestamp": (datetime.now() - timedelta(hours=2)).isoformat(),
+            "timestamp": "__TS_2H__",
             "confidence": 78
         },
         {
             "id": 2,
             "type": "model_training",
             "message": "LSTM model training completed with 91% accuracy",
-            "timestamp": (datetime.now() - timedelta(hours=4)).isoformat(),
+            "timestamp": "__TS_4H__",
             "accuracy": 91
         },
         {
             "id": 3,
             "type": "environmental_alert",
             "message": "Temperature anomaly detected at Kochi station",
-            "timestamp": (datetime.now() - timedelta(hours=6)).isoformat(),
+            "timestamp": "__TS_6H__",
             "severity": "warning"
         }
     ]
-    return {"activities": activities}
-
-# ============================================================================
-# SPECIES MAP ENDPOINTS
-# ============================================================================
+})
 
-@app.get("/api/species/map-data")
-async def get_species_map_data():
-    """Get species distribution data for mapping"""
-    # Mock data - replace with actual database queries
-    species_data = [
+_SPECIES_MAP_TEMPLATE = orjson.dumps({
+    "species": [
         {
             "id": 1,
             "name": "Indian Oil Sardine",
@@ -132,7 +205,7 @@ async def get_species_map_data():
             "status": "LC",
             "type": "fish",
             "abundance": 1240,
-            "lastSeen": (datetime.now() - timedelta(hours=2)).isoformat()
+            "lastSeen": "__TS_2H__"
         },
         {
             "id": 2,
@@ -144,20 +217,154 @@ async def get_species_map_data():
             "status": "EN",
             "type": "fish",
             "abundance": 45,
-            "lastSeen": (datetime.now() - timedelta(hours=4)).isoformat()
+            "lastSeen": "__TS_4H__"
+        }
+    ],
+    "total": 2
+})
+
+_EDNA_RESULTS_TEMPLATE = orjson.dumps({
+    "analysis_id": "__ANALYSIS_ID__",
+    "status": "completed",
+    "completion_time": "__TS__",
+    "summary": {
+        "total_families": 287,
+        "fish_species": 152,
+        "classification_accuracy": 96
+    },
+    "species_detected": [
+        {
+            "name": "Indian Oil Sardine",
+            "scientific": "Sardinella longiceps",
+            "confidence": 96,
+            "abundance": 1240,
+            "status": "LC"
+        },
+        {
+            "name": "Green Sawfish",
+            "scientific": "Pristis zijsron",
+            "confidence": 82,
+            "abundance": 3,
+            "status": "CR"
         }
     ]
-    return {"species": species_data, "total": len(species_data)}
+})
+
+_CLASSIFY_RESULT_TEMPLATE = orjson.dumps({
+    "species": {
+        "scientific": "Rastrelliger kanagurta",
+        "common": "Indian Mackerel"
+    },
+    "confidence": 96.7,
+    "morphometric": {
+        "length": 15.2,
+        "width": 12.8,
+        "circularity": 0.847,
+        "age_estimate": 3
+    },
+    "processing": {
+        "features_extracted": 2048,
+        "inference_time_ms": 247,
+        "model": "ResNet-50",
+        "accuracy": "94%"
+    },
+    "timestamp": "__TS__"
+})
+
+def _json_response(body: bytes) -> Response:
+    """Wrap precomputed JSON bytes in a response without re-serializing"""
+    return Response(content=body, media_type="application/json")
+
+def _new_id(prefix: str) -> str:
+    """Generate a time-ordered identifier that can't collide within a second"""
+    token = base64.b32encode(time.time_ns().to_bytes(8, "big")).rstrip(b"=").decode().lower()
+    return f"{prefix}_{token}"
+
+# Current timestamp, pre-formatted and refreshed once a second by a
+# background task, so high-frequency handlers don't pay for a clock read
+# plus string formatting on every request
+_NOW_ISO = datetime.now().isoformat().encode()
+
+async def _refresh_timestamp():
+    """Keep the cached ISO timestamp fresh at 1-second granularity"""
+    global _NOW_ISO
+    while True:
+        _NOW_ISO = datetime.now().isoformat().encode()
+        await asyncio.sleep(1)
+
+@app.on_event("startup")
+async def start_timestamp_refresher():
+    asyncio.create_task(_refresh_timestamp())
+
+def _stamped(template: bytes) -> bytes:
+    """Patch the timestamp sentinel in a precomputed JSON template"""
+    return template.replace(_TS_SENTINEL, _NOW_ISO)
+
+def _stamped_offsets(template: bytes) -> bytes:
+    """Patch relative-time sentinels with offsets from the current time"""
+    now = datetime.now()
+    for hours, sentinel in ((2, b"__TS_2H__"), (4, b"__TS_4H__"), (6, b"__TS_6H__")):
+        template = template.replace(sentinel, (now - timedelta(hours=hours)).isoformat().encode())
+    return template
+
+# ============================================================================
+# API ENDPOINTS
+# ============================================================================
+
+@app.get("/")
+async def serve_index():
+    """Serve the main application (sendfile path, no blocking read)"""
+    return FileResponse("frontend/index.html")
+
+@app.get("/api/health")
+async def health_check():
+    """Health check endpoint"""
+    return _json_response(_stamped(_HEALTH_TEMPLATE))
+
+# ============================================================================
+# DASHBOARD ENDPOINTS
+# ============================================================================
+
+@app.get("/api/dashboard/stats")
+async def get_dashboard_stats():
+    """Get dashboard KPI statistics"""
+    return _json_response(_DASHBOARD_STATS)
+
+# Recent activity is rendered once a minute by a background task; the
+# UI's relative times don't need second-level precision, so requests
+# just return the latest pre-rendered bytes
+_RECENT_ACTIVITY_JSON = _stamped_offsets(_RECENT_ACTIVITY_TEMPLATE)
+
+async def _refresh_recent_activity():
+    """Re-render the recent-activity payload once a minute"""
+    global _RECENT_ACTIVITY_JSON
+    while True:
+        _RECENT_ACTIVITY_JSON = _stamped_offsets(_RECENT_ACTIVITY_TEMPLATE)
+        await asyncio.sleep(60)
+
+@app.on_event("startup")
+async def start_recent_activity_refresher():
+    asyncio.create_task(_refresh_recent_activity())
+
+@app.get("/api/dashboard/recent-activity")
+async def get_recent_activity():
+    """Get recent system activity"""
+    return _json_response(_RECENT_ACTIVITY_JSON)
+
+# ============================================================================
+# SPECIES MAP ENDPOINTS
+# ============================================================================
+
+@app.get("/api/species/map-data")
+async def get_species_map_data():
+    """Get species distribution data for mapping"""
+    # Mock data - replace with actual database queries
+    return _json_response(_stamped_offsets(_SPECIES_MAP_TEMPLATE))
 
 @app.get("/api/species/biodiversity-hotspots")
 async def get_biodiversity_hotspots():
     """Get biodiversity hotspot data"""
-    hotspots = [
-        {"location": "Kochi", "diversity_index": 4.2, "species_count": 156},
-        {"location": "Trivandrum", "diversity_index": 3.8, "species_count": 134},
-        {"location": "Calicut", "diversity_index": 2.9, "species_count": 98}
-    ]
-    return {"hotspots": hotspots}
+    return _json_response(_BIODIVERSITY_HOTSPOTS)
 
 # ============================================================================
 # OCEANOGRAPHIC ENDPOINTS
@@ -166,23 +373,33 @@ async def get_biodiversity_hotspots():
 @app.get("/api/oceanographic/parameters")
 async def get_oceanographic_parameters():
     """Get current oceanographic parameters"""
-    parameters = {
-        "temperature": {"value": 28.4, "unit": "°C", "trend": 0.2, "status": "normal"},
-        "salinity": {"value": 34.2, "unit": "ppt", "trend": 0.0, "status": "normal"},
-        "chlorophyll": {"value": 2.1, "unit": "mg/m³", "trend": -0.3, "status": "normal"},
-        "ph": {"value": 8.1, "unit": "", "trend": 0.0, "status": "normal"},
-        "oxygen": {"value": 6.8, "unit": "mg/L", "trend": 0.1, "status": "normal"}
-    }
-    return {"parameters": parameters, "timestamp": datetime.now().isoformat()}
+    return _json_response(_stamped(_OCEAN_PARAMETERS_TEMPLATE))
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _forecast_signal(base, hours, noise):
+    """Fused single-pass kernel for the daily-cycle forecast signal"""
+    actual = np.empty(hours)
+    predicted = np.empty(hours)
+    k = 2 * np.pi / 24
+    for i in prange(hours):
+        daily_cycle = math.sin(i * k) * 0.5
+        actual[i] = round((base + daily_cycle + noise[i]) * 100) / 100
+        predicted[i] = round((base + daily_cycle + noise[i] * 0.3) * 100) / 100
+    return actual, predicted
+
+# Warm the JIT at import so the first request doesn't pay compilation cost
+_forecast_signal(25.0, 24, np.zeros(24))
 
 @app.get("/api/oceanographic/forecast/{parameter}")
-async def get_parameter_forecast(parameter: str, hours: int = 168):
-    """Get LSTM forecast for oceanographic parameter"""
-    # Generate realistic forecast data
-    timestamps = []
-    values = []
-    predictions = []
-
+@cache(expire=60)  # keyed on (parameter, hours) via the default key builder
+async def get_parameter_forecast(parameter: str, hours: int = 168,
+                                 fields: Optional[str] = None):
+    """Get LSTM forecast for oceanographic parameter
+
+    `fields` is an optional comma-separated subset of
+    timestamps/historical/forecast so clients only pay for the series
+    they render.
+    """
     base_values = {
         "temperature": 28.4,
         "salinity": 34.2,
@@ -193,28 +410,30 @@ async def get_parameter_forecast(parameter: str, hours: int = 168):
 
     base_value = base_values.get(parameter, 25.0)
 
-    for i in range(hours):
-        timestamp = datetime.now() + timedelta(hours=i)
-        timestamps.append(timestamp.isoformat())
+    # Generate realistic forecast data in one fused pass over the arrays
+    noise = _RNG.standard_normal(hours) * 0.1
+    actual, predicted = _forecast_signal(base_value, hours, noise)
 
-        # Add realistic variations
-        daily_cycle = np.sin(i * 2 * np.pi / 24) * 0.5
-        noise = np.random.normal(0, 0.1)
+    # Slice the arrays before converting so only the returned portion of
+    # each series is materialized as a Python list
+    split = (hours * 7) // 10
+    wanted = set(fields.split(",")) if fields else None
 
-        actual_value = base_value + daily_cycle + noise
-        predicted_value = base_value + daily_cycle + noise * 0.3
-
-        values.append(round(actual_value, 2))
-        predictions.append(round(predicted_value, 2))
-
-    return {
+    result = {
         "parameter": parameter,
-        "timestamps": timestamps,
-        "historical": values[:int(hours*0.7)],
-        "forecast": predictions[int(hours*0.7):],
         "accuracy": 91.3,
         "model": "LSTM"
     }
+    if wanted is None or "timestamps" in wanted:
+        result["timestamps"] = pd.date_range(
+            datetime.now(), periods=hours, freq="H"
+        ).strftime("%Y-%m-%dT%H:%M:%S").tolist()
+    if wanted is None or "historical" in wanted:
+        result["historical"] = actual[:split].tolist()
+    if wanted is None or "forecast" in wanted:
+        result["forecast"] = predicted[split:].tolist()
+
+    return result
 
 # ============================================================================
 # EDNA ANALYSIS ENDPOINTS
@@ -226,19 +445,24 @@ async def upload_edna_files(files: List[UploadFile] = File(...)):
     uploaded_files = []
 
     for file in files:
-        # Validate file format
-        valid_extensions = [".fasta", ".fastq", ".fa", ".fq"]
-        if not any(file.filename.lower().endswith(ext) for ext in valid_extensions):
-            raise HTTPException(status_code=400, f"Invalid file format: {file.filename}")
-
-        # Save file (in production, save to proper storage)
-        content = await file.read()
+        # Validate file format (endswith checks the whole tuple in one C call)
+        if not file.filename.lower().endswith(_VALID_EDNA_EXTENSIONS):
+            raise HTTPException(status_code=400, detail=f"Invalid file format: {file.filename}")
+
+        # Stream the upload to disk in chunks instead of buffering the
+        # whole payload on the event loop
+        destination = UPLOAD_DIR / Path(file.filename).name
+        size = 0
+        async with aiofiles.open(destination, "wb") as out:
+            while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+                await out.write(chunk)
+                size += len(chunk)
 
         uploaded_files.append({
             "filename": file.filename,
-            "size": len(content),
+            "size": size,
             "content_type": file.content_type,
-            "upload_time": datetime.now().isoformat()
+            "upload_time": datetime.now()
         })
 
     return {"uploaded_files": uploaded_files, "total_files": len(uploaded_files)}
@@ -248,7 +472,7 @@ async def start_edna_analysis(background_tasks: BackgroundTasks,
                              gene_target: str = "18s",
                              analysis_type: str = "taxonomy"):
     """Start eDNA sequence analysis"""
-    analysis_id = f"analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    analysis_id = _new_id("analysis")
 
     # Start background analysis task
     background_tasks.add_task(run_edna_analysis, analysis_id, gene_target, analysis_type)
@@ -265,70 +489,83 @@ async def start_edna_analysis(background_tasks: BackgroundTasks,
 async def get_edna_results(analysis_id: str):
     """Get eDNA analysis results"""
     # Mock results - replace with actual analysis results
-    results = {
-        "analysis_id": analysis_id,
-        "status": "completed",
-        "completion_time": datetime.now().isoformat(),
-        "summary": {
-            "total_families": 287,
-            "fish_species": 152,
-            "classification_accuracy": 96
-        },
-        "species_detected": [
-            {
-                "name": "Indian Oil Sardine",
-                "scientific": "Sardinella longiceps",
-                "confidence": 96,
-                "abundance": 1240,
-                "status": "LC"
-            },
-            {
-                "name": "Green Sawfish",
-                "scientific": "Pristis zijsron",
-                "confidence": 82,
-                "abundance": 3,
-                "status": "CR"
-            }
-        ]
-    }
-    return results
+    body = _stamped(_EDNA_RESULTS_TEMPLATE).replace(
+        b'"__ANALYSIS_ID__"', orjson.dumps(analysis_id)
+    )
+    return _json_response(body)
 
 # ============================================================================
 # OTOLITH CLASSIFICATION ENDPOINTS
 # ============================================================================
 
+def _classify_otolith_sync(image_file: BinaryIO) -> bytes:
+    """Run otolith classification on a worker thread (CPU-bound)
+
+    Takes the upload's spooled file object so the image can be decoded
+    progressively (e.g. PIL.Image.open) without a full in-memory copy.
+    Returns the serialized result.
+    """
+    # Mock classification (replace with actual model inference)
+    return _stamped(_CLASSIFY_RESULT_TEMPLATE)
+
+# Micro-batching: classification requests arriving within a short window
+# are collected and run as one batched pass, amortizing per-call model
+# overhead when images arrive in bursts
+_CLASSIFY_BATCH_MAX = 8
+_CLASSIFY_BATCH_WINDOW = 0.01  # seconds
+_classify_queue: asyncio.Queue = asyncio.Queue()
+
+def _classify_otolith_batch(image_files: List[BinaryIO]) -> List[bytes]:
+    """Classify a batch of otolith images in a single pass
+
+    With a real model this is where the per-image tensors get stacked
+    (torch.stack) and pushed through one forward pass under
+    torch.inference_mode().
+    """
+    return [_classify_otolith_sync(image_file) for image_file in image_files]
+
+async def _classify_worker():
+    """Drain the classification queue in micro-batches"""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _classify_queue.get()]
+        deadline = loop.time() + _CLASSIFY_BATCH_WINDOW
+        while len(batch) < _CLASSIFY_BATCH_MAX:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_classify_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        files, futures = zip(*batch)
+        try:
+            results = await run_in_threadpool(_classify_otolith_batch, list(files))
+        except Exception as exc:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+            continue
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
+
+@app.on_event("startup")
+async def start_classify_worker():
+    asyncio.create_task(_classify_worker())
+
 @app.post("/api/otolith/classify")
 async def classify_otolith(file: UploadFile = File(...)):
     """Classify otolith image using ResNet model"""
     if not file.content_type.startswith("image/"):
         raise HTTPException(status_code=400, detail="File must be an image")
 
-    # Read and process image
-    image_data = await file.read()
-
-    # Mock classification (replace with actual model inference)
-    classification_result = {
-        "species": {
-            "scientific": "Rastrelliger kanagurta",
-            "common": "Indian Mackerel"
-        },
-        "confidence": 96.7,
-        "morphometric": {
-            "length": 15.2,
-            "width": 12.8,
-            "circularity": 0.847,
-            "age_estimate": 3
-        },
-        "processing": {
-            "features_extracted": 2048,
-            "inference_time_ms": 247,
-            "model": "ResNet-50",
-            "accuracy": "94%"
-        },
-        "timestamp": datetime.now().isoformat()
-    }
-
-    return classification_result
+    # Queue the spooled upload for the micro-batching worker and wait for
+    # its slot in the next batched pass
+    future = asyncio.get_running_loop().create_future()
+    await _classify_queue.put((file.file, future))
+    return _json_response(await future)
 
 # ============================================================================
 # ML TRAINING ENDPOINTS
@@ -337,40 +574,14 @@ async def classify_otolith(file: UploadFile = File(...)):
 @app.get("/api/ml/models")
 async def get_available_models():
     """Get list of available ML models"""
-    models = [
-        {
-            "id": "otolith",
-            "name": "ResNet Otolith Classifier",
-            "type": "image_classification",
-            "status": "trained",
-            "accuracy": 94.2,
-            "last_trained": "2025-09-26T06:18:00Z"
-        },
-        {
-            "id": "lstm",
-            "name": "LSTM Environmental Predictor",
-            "type": "time_series",
-            "status": "training",
-            "accuracy": 91.3,
-            "last_trained": "2025-09-26T04:20:00Z"
-        },
-        {
-            "id": "edna",
-            "name": "Random Forest eDNA Classifier",
-            "type": "classification",
-            "status": "deployed",
-            "accuracy": 96.1,
-            "last_trained": "2025-09-25T18:45:00Z"
-        }
-    ]
-    return {"models": models}
+    return _json_response(_AVAILABLE_MODELS)
 
 @app.post("/api/ml/train/{model_id}")
 async def start_model_training(model_id: str, background_tasks: BackgroundTasks,
                               batch_size: int = 32, learning_rate: float = 0.001,
                               epochs: int = 100):
     """Start training an ML model"""
-    training_id = f"training_{model_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    training_id = _new_id(f"training_{model_id}")
 
     training_config = {
         "model_id": model_id,
@@ -380,6 +591,9 @@ async def start_model_training(model_id: str, background_tasks: BackgroundTasks,
         "gpu": "cuda:0" if torch.cuda.is_available() else "cpu"
     }
 
+    # Record the run in Redis so status is visible from any worker
+    await redis_client.hset(f"training:{training_id}", mapping={"status": "started", **training_config})
+
     # Start background training task
     background_tasks.add_task(run_model_training, training_id, training_config)
 
@@ -393,48 +607,49 @@ async def start_model_training(model_id: str, background_tasks: BackgroundTasks,
 @app.get("/api/ml/training/{training_id}/status")
 async def get_training_status(training_id: str):
     """Get training status and metrics"""
-    # Mock training status
-    status = {
-        "training_id": training_id,
-        "status": "training",
-        "current_epoch": 45,
-        "total_epochs": 100,
-        "current_loss": 0.234,
-        "current_accuracy": 0.891,
-        "best_accuracy": 0.923,
-        "elapsed_time": "23 minutes",
-        "estimated_remaining": "27 minutes"
-    }
-    return status
+    status = await redis_client.hgetall(f"training:{training_id}")
+    if not status:
+        raise HTTPException(status_code=404, detail=f"Unknown training run: {training_id}")
+    return {"training_id": training_id, **status}
 
 # ============================================================================
 # AI ASSISTANT ENDPOINTS
 # ============================================================================
 
+# Simple response mapping (replace with actual NLP model)
+_CHAT_RESPONSES = {
+    "endangered": "Based on current data, Kerala waters host 2 endangered and 1 critically endangered species. The endangered species are Malabar Grouper (Epinephelus malabaricus) with 15 specimens recorded, and Grey Reef Shark (Carcharhinus amblyrhynchos) with 8 specimens.",
+    "temperature": "The average sea surface temperature across Kerala monitoring stations this month is 28.4°C, which is 0.6°C above the long-term average. Our LSTM model predicts that a 1°C temperature increase correlates with a 15% decline in sardine populations.",
+    "biodiversity": "According to our eDNA analysis, the Trivandrum coast shows the highest biodiversity with an index of 4.2, detecting 15 species in recent samples. This is followed by Kochi waters (3.8 index, 12 species).",
+    "edna": "Environmental DNA metabarcoding achieves 96% accuracy for marine species detection when using 18S rRNA gene sequencing. Our Random Forest classifier successfully identified 287 eukaryotic families from 500 seawater samples."
+}
+
+_CHAT_DEFAULT = "I'm BluePulse AI, trained on 10,000+ marine research papers. I can help with species identification, environmental analysis, and conservation questions. What would you like to know?"
+
+# Keyword matching automaton built once at import: a single pass over the
+# message finds any keyword, instead of one substring scan per keyword
+_CHAT_AUTOMATON = ahocorasick.Automaton()
+for _keyword, _response in _CHAT_RESPONSES.items():
+    _CHAT_AUTOMATON.add_word(_keyword, _response)
+_CHAT_AUTOMATON.make_automaton()
+
+class ChatIn(BaseModel):
+    """Chat request payload"""
+    model_config = ConfigDict(extra="ignore")
+
+    message: str = ""
+
 @app.post("/api/ai/chat")
-async def chat_with_ai(message: dict):
+async def chat_with_ai(body: ChatIn):
     """Chat with the marine AI assistant"""
-    user_message = message.get("message", "")
-
-    # Simple response mapping (replace with actual NLP model)
-    responses = {
-        "endangered": "Based on current data, Kerala waters host 2 endangered and 1 critically endangered species. The endangered species are Malabar Grouper (Epinephelus malabaricus) with 15 specimens recorded, and Grey Reef Shark (Carcharhinus amblyrhynchos) with 8 specimens.",
-        "temperature": "The average sea surface temperature across Kerala monitoring stations this month is 28.4°C, which is 0.6°C above the long-term average. Our LSTM model predicts that a 1°C temperature increase correlates with a 15% decline in sardine populations.",
-        "biodiversity": "According to our eDNA analysis, the Trivandrum coast shows the highest biodiversity with an index of 4.2, detecting 15 species in recent samples. This is followed by Kochi waters (3.8 index, 12 species).",
-        "edna": "Environmental DNA metabarcoding achieves 96% accuracy for marine species detection when using 18S rRNA gene sequencing. Our Random Forest classifier successfully identified 287 eukaryotic families from 500 seawater samples."
-    }
-
-    # Simple keyword matching
-    response_text = responses.get("default", "I'm BluePulse AI, trained on 10,000+ marine research papers. I can help with species identification, environmental analysis, and conservation questions. What would you like to know?")
+    user_message = body.message.lower()
 
-    for keyword, response in responses.items():
-        if keyword in user_message.lower():
-            response_text = response
-            break
+    hit = next(_CHAT_AUTOMATON.iter(user_message), None)
+    response_text = hit[1] if hit else _CHAT_DEFAULT
 
     return {
         "response": response_text,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.now(),
         "model": "DistilBERT",
         "confidence": 0.89
     }
@@ -467,15 +682,31 @@ async def run_model_training(training_id: str, config: dict):
     logger.info(f"Starting model training: {training_id}")
 
     epochs = config["epochs"]
+    await redis_client.hset(f"training:{training_id}", "status", "training")
 
+    best_accuracy = 0.0
     for epoch in range(epochs):
         # Simulate training epoch
         await asyncio.sleep(1)
 
+        # Publish per-epoch metrics so status reads see live progress from
+        # any worker (synthetic values until real training is wired in)
+        loss = round(1.0 / (1 + epoch * 0.1), 4)
+        accuracy = round(0.5 + 0.45 * (epoch + 1) / epochs, 4)
+        best_accuracy = max(best_accuracy, accuracy)
+        await redis_client.hset(f"training:{training_id}", mapping={
+            "current_epoch": epoch + 1,
+            "total_epochs": epochs,
+            "current_loss": loss,
+            "current_accuracy": accuracy,
+            "best_accuracy": best_accuracy
+        })
+
         # Log progress
         if epoch % 10 == 0:
             logger.info(f"{training_id}: Epoch {epoch}/{epochs}")
 
+    await redis_client.hset(f"training:{training_id}", "status", "completed")
     logger.info(f"Model training completed: {training_id}")
 
 # ============================================================================
@@ -488,11 +719,16 @@ if __name__ == "__main__":
     os.makedirs("data", exist_ok=True)
     os.makedirs("uploads", exist_ok=True)
 
-    # Start the server
+    # Start the server: one worker per core on uvloop + httptools.
+    # Set BLUEPULSE_DEV=1 for single-worker auto-reload during development.
+    dev_mode = os.getenv("BLUEPULSE_DEV", "0") == "1"
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        workers=1 if dev_mode else os.cpu_count(),
+        loop="uvloop",
+        http="httptools",
+        reload=dev_mode,
         log_level="info"
     )
\ No newline at end of file